@@ -2,21 +2,28 @@
 
 from __future__ import annotations
 
+import asyncio
 import datetime as dt
+import functools
+import hashlib
 import json
 import os
+import time
+from collections import OrderedDict
 from dataclasses import dataclass
 from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
 from zoneinfo import ZoneInfo
 
 import geopandas as gpd
 import pandas as pd
+import httpx
 import numpy as np
+import orjson
+from pyproj import Transformer
 import rasterio
 from rasterio.features import shapes as rio_shapes
-import requests
+import shapely
 from shapely.geometry import shape, box, mapping, Point
-from shapely.ops import unary_union
 
 # Optional local buildings override (bypass HTTP)
 ENGINE_BUILDING_LOCAL_GEOJSON = os.getenv("ENGINE_BUILDING_LOCAL_GEOJSON") or os.getenv(
@@ -24,14 +31,26 @@ ENGINE_BUILDING_LOCAL_GEOJSON = os.getenv("ENGINE_BUILDING_LOCAL_GEOJSON") or os
 )
 
 _PYBDSHADOW_API: str | None = None
+# Shared HTTP/2 client for backend building fetches (created lazily per process)
+_HTTP_CLIENT: httpx.Client | None = None
 # Default canopy raster path (can be overridden by env or request metadata)
 CANOPY_RASTER_PATH = (
     os.getenv("CANOPY_RASTER_PATH")
     or os.getenv("SHADOW_ENGINE_CANOPY_RASTER_PATH")
     or ""
 )
+# Shared lon/lat -> Web Mercator transformer for area calculations
+_TO_WEB_MERCATOR = Transformer.from_crs(4326, 3857, always_xy=True)
+# Target zone for timestamps handed to pybdshadow
+_UTC = ZoneInfo("UTC")
 # Minimum canopy height (meters) to consider
 CANOPY_HEIGHT_THRESHOLD = float(os.getenv('CANOPY_HEIGHT_THRESHOLD', '1'))
+# Per-process reuse of fetched/preprocessed buildings across requests (TTL <= 0 disables fetch reuse)
+BUILDING_CACHE_TTL_SECONDS = float(os.getenv("ENGINE_BUILDING_CACHE_TTL", "300"))
+BUILDING_CACHE_SIZE = int(os.getenv("ENGINE_BUILDING_CACHE_SIZE", "64"))
+_PREPROCESS_CACHE: "OrderedDict[str, gpd.GeoDataFrame]" = OrderedDict()
+# Above this maxFeatures, fetch the bbox as four concurrent quadrant requests (<= 0 disables)
+BUILDING_CHUNK_THRESHOLD = int(os.getenv("ENGINE_BUILDING_CHUNK_THRESHOLD", "4000"))
 try:  # pragma: no cover - handled at runtime
     import pybdshadow as _PYBDSHADOW_MODULE  # type: ignore
 except ImportError as exc:
@@ -53,6 +72,11 @@ except ImportError as exc:
 else:
     _PYBDSHADOW_API = "submodule"
 
+try:  # pragma: no cover - optional C ISO-8601 parser
+    from ciso8601 import parse_datetime as _fast_parse_datetime
+except ImportError:
+    _fast_parse_datetime = None
+
 
 def _read_local_buildings(bounds: Mapping[str, float], local_path: str) -> Dict[str, Any]:
     """Read buildings from a local GeoJSON/GPKG and return FeatureCollection-like dict."""
@@ -70,6 +94,14 @@ def _read_local_buildings(bounds: Mapping[str, float], local_path: str) -> Dict[
     }
 
 
+def _http_client() -> httpx.Client:
+    # Built on first use so pool workers never inherit a forked connection pool.
+    global _HTTP_CLIENT
+    if _HTTP_CLIENT is None:
+        _HTTP_CLIENT = httpx.Client(http2=True, timeout=60, headers={"Accept-Encoding": "gzip"})
+    return _HTTP_CLIENT
+
+
 def fetch_buildings(bounds: Mapping[str, float], backend_url: str, max_features: int) -> Dict[str, Any]:
     # Prefer local override if provided
     if ENGINE_BUILDING_LOCAL_GEOJSON:
@@ -77,43 +109,153 @@ def fetch_buildings(bounds: Mapping[str, float], backend_url: str, max_features:
 
     url = f"{backend_url.rstrip('/')}/api/buildings/bounds"
     payload = {**bounds, "maxFeatures": max_features}
-    response = requests.post(url, json=payload, timeout=60)
-    response.raise_for_status()
-    data = response.json()
+    try:
+        response = _http_client().post(url, json=payload)
+    except httpx.HTTPError as exc:
+        raise _backend_request_error(exc) from exc
+    return _parse_buildings_response(response)
+
+
+# httpx exceptions take keyword-only constructor arguments and cannot be unpickled,
+# so re-raised across the engine's process pool they surface as BrokenProcessPool.
+# Backend failures are therefore reported as plain RuntimeErrors.
+def _backend_request_error(exc: httpx.HTTPError) -> RuntimeError:
+    return RuntimeError(f"Backend request failed: {type(exc).__name__}: {exc}")
+
+
+def _parse_buildings_response(response: httpx.Response) -> Dict[str, Any]:
+    if not response.is_success:
+        raise RuntimeError(f"Backend HTTP {response.status_code}: {response.text[:200]}")
+    data = orjson.loads(response.content)
     if not data.get("success"):
         raise RuntimeError(f"Backend returned error: {data.get('message')}")
     return data["data"]
 
 
-def extract_height(properties: Mapping[str, Any]) -> float:
+def _split_bounds(bounds: Mapping[str, float]) -> List[Dict[str, float]]:
+    mid_lon = (bounds["west"] + bounds["east"]) / 2.0
+    mid_lat = (bounds["south"] + bounds["north"]) / 2.0
+    return [
+        {"west": bounds["west"], "south": bounds["south"], "east": mid_lon, "north": mid_lat},
+        {"west": mid_lon, "south": bounds["south"], "east": bounds["east"], "north": mid_lat},
+        {"west": bounds["west"], "south": mid_lat, "east": mid_lon, "north": bounds["north"]},
+        {"west": mid_lon, "south": mid_lat, "east": bounds["east"], "north": bounds["north"]},
+    ]
+
+
+async def _fetch_buildings_chunked(
+    bounds: Mapping[str, float],
+    backend_url: str,
+    max_features: int,
+) -> gpd.GeoDataFrame:
+    """Fetch the bbox as quadrants in parallel, decoding each one while the rest are in flight.
+
+    Each quadrant gets an equal share of ``max_features``. Quadrants that come back full are
+    fetched once more with the budget the sparser quadrants left unused, so the quadrants never
+    ask for more than ``max_features`` in total and a skewed bbox is not cut short.
+    """
+    url = f"{backend_url.rstrip('/')}/api/buildings/bounds"
+    quadrants = _split_bounds(bounds)
+    share, remainder = divmod(max_features, len(quadrants))
+    budgets = [share + (1 if index < remainder else 0) for index in range(len(quadrants))]
+    returned = [0] * len(quadrants)
+    frames: List[Optional[gpd.GeoDataFrame]] = [None] * len(quadrants)
+
+    async with httpx.AsyncClient(http2=True, timeout=60, headers={"Accept-Encoding": "gzip"}) as client:
+
+        async def fetch_quadrant(index: int) -> Tuple[int, Dict[str, Any]]:
+            payload = {**quadrants[index], "maxFeatures": budgets[index]}
+            try:
+                response = await client.post(url, json=payload)
+            except httpx.HTTPError as exc:
+                raise _backend_request_error(exc) from exc
+            return index, _parse_buildings_response(response)
+
+        async def fetch_quadrants(indices: Iterable[int]) -> None:
+            pending = [fetch_quadrant(index) for index in indices if budgets[index] > 0]
+            for next_done in asyncio.as_completed(pending):
+                index, data = await next_done
+                features = data.get("features", [])
+                returned[index] = len(features)
+                frames[index] = features_to_gdf(features)
+
+        await fetch_quadrants(range(len(quadrants)))
+
+        # A quadrant that filled its share may have been cut short; hand it what the others left.
+        full = [index for index in range(len(quadrants)) if returned[index] >= budgets[index]]
+        spare = sum(budgets[index] - returned[index] for index in range(len(quadrants)) if index not in full)
+        if full and spare > 0:
+            extra, remainder = divmod(spare, len(full))
+            for position, index in enumerate(full):
+                budgets[index] += extra + (1 if position < remainder else 0)
+            await fetch_quadrants(full)
+
+    # Concatenate in quadrant order so the result (and its preprocess cache key) is stable.
+    buildings = pd.concat([frame for frame in frames if frame is not None], ignore_index=True)
+    # Footprints straddling a quadrant edge are returned by both sides.
+    duplicated = pd.Series(shapely.to_wkb(buildings.geometry.to_numpy())).duplicated().to_numpy()
+    return buildings[~duplicated].reset_index(drop=True)
+
+
+def _fetch_buildings_gdf(bounds: Mapping[str, float], backend_url: str, max_features: int) -> gpd.GeoDataFrame:
+    if not ENGINE_BUILDING_LOCAL_GEOJSON and 0 < BUILDING_CHUNK_THRESHOLD < max_features:
+        return asyncio.run(_fetch_buildings_chunked(bounds, backend_url, max_features))
+    raw = fetch_buildings(bounds, backend_url, max_features)
+    return features_to_gdf(raw.get("features", []))
+
+
+def extract_heights(records: pd.DataFrame, properties: List[Mapping[str, Any]]) -> pd.Series:
+    # First non-null value float() accepts from height / HEIGHT / height_mean, then levels * 3.5,
+    # else 12 m. A value that parses to NaN (NaN, "nan") still wins, so it stays NaN.
+    heights = np.full(len(records), np.nan)
+    unresolved = np.ones(len(records), dtype=bool)
     for key in ("height", "HEIGHT", "height_mean", "levels"):
-        value = properties.get(key)
-        if value is None:
+        if key not in records.columns:
             continue
-        try:
-            height = float(value)
-        except (TypeError, ValueError):
-            continue
-        if key == "levels":
-            return height * 3.5
-        return height
-    return 12.0
+        scale = 3.5 if key == "levels" else 1.0
+        values = pd.to_numeric(records[key], errors="coerce").to_numpy(dtype=float, na_value=np.nan)
+        found = unresolved & ~np.isnan(values)
+        heights[found] = values[found] * scale
+        # pandas cannot tell a missing key from NaN, and rejects some strings float() takes
+        # ("nan", "1_000"), so settle the remaining rows against the raw properties.
+        for index in np.flatnonzero(unresolved & np.isnan(values)):
+            value = properties[index].get(key)
+            if value is None:
+                continue
+            try:
+                height = float(value)
+            except (TypeError, ValueError):
+                continue
+            heights[index] = height * scale
+            found[index] = True
+        unresolved &= ~found
+    heights[unresolved] = 12.0
+    return pd.Series(heights, index=records.index)
 
 
 def features_to_gdf(features: Iterable[Dict[str, Any]]) -> gpd.GeoDataFrame:
-    records: List[Dict[str, Any]] = []
-    geometries = []
-    for feature in features:
-        geom = feature.get("geometry")
-        if not geom:
-            continue
-        shapely_geom = shape(geom)
-        props = feature.get("properties") or {}
-        props = dict(props)
-        props.setdefault("height_m", extract_height(props))
-        records.append(props)
-        geometries.append(shapely_geom)
+    features = [feature for feature in features if feature.get("geometry")]
+    properties = [feature.get("properties") or {} for feature in features]
+    records = pd.DataFrame(properties)
+    heights = extract_heights(records, properties)
+    if "height_m" in records.columns:
+        # Like dict.setdefault: a feature that already has a height_m key keeps its value and
+        # only features without the key get the derived height. The column dtype is inferred
+        # as GeoDataFrame(records) did, so None reads back as NaN in an all-numeric column.
+        records["height_m"] = pd.Series(
+            [
+                props["height_m"] if "height_m" in props else height
+                for props, height in zip(properties, heights.tolist())
+            ],
+            index=records.index,
+        )
+    else:
+        records["height_m"] = heights
 
+    # Decode every geometry in a single GEOS call rather than shape() per feature.
+    geometries = shapely.from_geojson(
+        np.array([json.dumps(feature["geometry"]) for feature in features], dtype=object)
+    )
     gdf = gpd.GeoDataFrame(records, geometry=geometries, crs="EPSG:4326")
     return gdf
 
@@ -149,13 +291,77 @@ def preprocess_buildings(buildings: gpd.GeoDataFrame) -> gpd.GeoDataFrame:
     return exploded
 
 
+def _buildings_digest(buildings: gpd.GeoDataFrame) -> str:
+    # Content key: geometry WKB plus the numeric values of every column preprocess_buildings
+    # reads heights from (coerced the same way, so list/dict properties hash as NaN).
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(str(buildings.crs).encode())
+    wkbs = shapely.to_wkb(buildings.geometry.to_numpy())
+    digest.update(b"".join(wkb if wkb is not None else b"\0" for wkb in wkbs))
+    height_columns = [
+        col for col in ("height", "height_m", "HEIGHT", "height_mean", "levels") if col in buildings.columns
+    ]
+    for col in height_columns:
+        digest.update(col.encode())
+        values = pd.to_numeric(buildings[col], errors="coerce")
+        digest.update(values.to_numpy(dtype=float, na_value=np.nan).tobytes())
+    return digest.hexdigest()
+
+
+def preprocess_buildings_cached(buildings: gpd.GeoDataFrame) -> gpd.GeoDataFrame:
+    """``preprocess_buildings`` memoised on a hash of the building geometries and heights."""
+    if BUILDING_CACHE_SIZE <= 0:
+        return preprocess_buildings(buildings)
+    key = _buildings_digest(buildings)
+    cached = _PREPROCESS_CACHE.get(key)
+    if cached is None:
+        cached = preprocess_buildings(buildings)
+        _PREPROCESS_CACHE[key] = cached
+        while len(_PREPROCESS_CACHE) > BUILDING_CACHE_SIZE:
+            _PREPROCESS_CACHE.popitem(last=False)
+    else:
+        _PREPROCESS_CACHE.move_to_end(key)
+    return cached.copy()
+
+
+@functools.lru_cache(maxsize=max(BUILDING_CACHE_SIZE, 1))
+def _load_buildings_cached(
+    bbox_key: Tuple[Tuple[str, float], ...],
+    backend_url: str,
+    max_features: int,
+    ttl_bucket: int,
+) -> gpd.GeoDataFrame:
+    return _fetch_buildings_gdf(dict(bbox_key), backend_url, max_features)
+
+
+def load_buildings(bounds: Mapping[str, float], backend_url: str, max_features: int) -> gpd.GeoDataFrame:
+    """Fetch buildings for a bbox as a GeoDataFrame, reusing recent results for the same query."""
+    if BUILDING_CACHE_TTL_SECONDS <= 0 or BUILDING_CACHE_SIZE <= 0:
+        return _fetch_buildings_gdf(bounds, backend_url, max_features)
+    bbox_key = tuple(sorted((key, float(value)) for key, value in bounds.items()))
+    # Entries from an older TTL window simply stop being hit and age out of the LRU.
+    ttl_bucket = int(time.monotonic() // BUILDING_CACHE_TTL_SECONDS)
+    return _load_buildings_cached(bbox_key, backend_url.rstrip("/"), max_features, ttl_bucket).copy()
+
+
 def parse_timestamp(value: str) -> dt.datetime:
+    if _fast_parse_datetime is not None:
+        try:
+            # Handles the trailing 'Z' and offsets natively
+            return _fast_parse_datetime(value)
+        except ValueError:
+            pass  # fall through for forms only fromisoformat accepts
     # Accept ISO strings that end with 'Z'
     if value.endswith('Z'):
         value = value[:-1] + '+00:00'
     return dt.datetime.fromisoformat(value)
 
 
+@functools.lru_cache(maxsize=32)
+def _tz(name: str) -> ZoneInfo:
+    return ZoneInfo(name)
+
+
 def generate_shadows(
     buildings: gpd.GeoDataFrame,
     timestamp: str,
@@ -168,7 +374,7 @@ def generate_shadows(
             "pybdshadow is not installed. Install dependencies listed in requirements.txt"
         ) from _IMPORT_ERROR
 
-    tzinfo = ZoneInfo(timezone)
+    tzinfo = _tz(timezone)
     naive_dt = parse_timestamp(timestamp)
     if naive_dt.tzinfo is None:
         aware_dt = naive_dt.replace(tzinfo=tzinfo)
@@ -186,14 +392,29 @@ def generate_shadows(
             height_field="height",
         )
 
-    utc_dt = aware_dt.astimezone(ZoneInfo("UTC"))
+    utc_dt = aware_dt.astimezone(_UTC)
     return sunlight_shadow(buildings, utc_dt)  # type: ignore[call-arg]
 
 
-def calculate_shadow_coverage(bounds: Dict[str, float], shadows: gpd.GeoDataFrame) -> Dict[str, float]:
-    bbox_geom = box(bounds['west'], bounds['south'], bounds['east'], bounds['north'])
-    bbox_series = gpd.GeoSeries([bbox_geom], crs="EPSG:4326").to_crs(3857)
-    bbox_area = float(bbox_series.area.iloc[0]) if not bbox_series.empty else 0.0
+def project_shadows(shadows: gpd.GeoDataFrame) -> gpd.GeoSeries:
+    """Shadow geometries in EPSG:3857 (shadows without a CRS are taken as EPSG:4326)."""
+    shadow_geoms = shadows.geometry
+    if shadow_geoms.crs is None:
+        shadow_geoms = shadow_geoms.set_crs("EPSG:4326")
+    return shadow_geoms.to_crs(3857)
+
+
+def calculate_shadow_coverage(
+    bounds: Dict[str, float],
+    shadows: gpd.GeoDataFrame,
+    shadows_projected: Optional[gpd.GeoSeries] = None,
+) -> Dict[str, float]:
+    # A lon/lat rectangle stays an axis-aligned rectangle in Web Mercator, so two
+    # corner transforms give its projected extent and area directly.
+    x0, y0 = _TO_WEB_MERCATOR.transform(bounds['west'], bounds['south'])
+    x1, y1 = _TO_WEB_MERCATOR.transform(bounds['east'], bounds['north'])
+    bbox_geom = box(x0, y0, x1, y1)
+    bbox_area = abs((x1 - x0) * (y1 - y0))
 
     if bbox_area <= 0 or shadows.empty:
         return {
@@ -202,7 +423,12 @@ def calculate_shadow_coverage(bounds: Dict[str, float], shadows: gpd.GeoDataFram
             'coverage_percent': 0.0,
         }
 
-    union = unary_union(shadows.geometry)
+    # Union the individual shadow polygons in metres rather than unioning in lon/lat
+    # and reprojecting one large multipolygon afterwards. Callers that already hold
+    # the EPSG:3857 shadows can pass them in to skip the transform.
+    if shadows_projected is None:
+        shadows_projected = project_shadows(shadows)
+    union = shapely.union_all(shadows_projected.to_numpy())
     if union.is_empty:
         return {
             'bbox_area_sqm': bbox_area,
@@ -210,7 +436,7 @@ def calculate_shadow_coverage(bounds: Dict[str, float], shadows: gpd.GeoDataFram
             'coverage_percent': 0.0,
         }
 
-    clipped = union.intersection(bbox_geom)
+    clipped = shapely.intersection(union, bbox_geom)
     if clipped.is_empty:
         return {
             'bbox_area_sqm': bbox_area,
@@ -218,8 +444,7 @@ def calculate_shadow_coverage(bounds: Dict[str, float], shadows: gpd.GeoDataFram
             'coverage_percent': 0.0,
         }
 
-    shadow_series = gpd.GeoSeries([clipped], crs="EPSG:4326").to_crs(3857)
-    shadow_area = float(shadow_series.area.iloc[0]) if not shadow_series.empty else 0.0
+    shadow_area = float(shapely.area(clipped))
     coverage = 0.0 if bbox_area == 0 else max(0.0, min(100.0, (shadow_area / bbox_area) * 100.0))
 
     return {
@@ -232,8 +457,23 @@ def calculate_shadow_coverage(bounds: Dict[str, float], shadows: gpd.GeoDataFram
 def gdf_to_feature_collection(gdf: gpd.GeoDataFrame) -> Dict[str, Any]:
     if gdf.empty:
         return {"type": "FeatureCollection", "features": []}
-    raw = json.loads(gdf.to_json())
-    return raw
+    # Build the FeatureCollection directly (same layout as gdf.to_json()) instead of
+    # serialising the whole frame to a string and parsing it straight back.
+    properties = pd.DataFrame(gdf.drop(columns=gdf.geometry.name)).astype(object)
+    properties = properties.where(properties.notna(), None)
+    geometry_values = gdf.geometry.to_numpy()
+    geometries = shapely.to_geojson(geometry_values)
+    geometries[shapely.is_empty(geometry_values)] = None
+    features = [
+        {
+            "id": str(idx),
+            "type": "Feature",
+            "properties": props,
+            "geometry": json.loads(geom) if geom is not None else None,
+        }
+        for idx, props, geom in zip(gdf.index, properties.to_dict(orient="records"), geometries)
+    ]
+    return {"type": "FeatureCollection", "features": features}
 
 
 def sample_grid(bounds: Dict[str, float], grid: int) -> List[Tuple[float, float]]:
@@ -302,7 +542,7 @@ def compute_sunlight_profile(
     step_minutes = max(5, min(step_minutes, 180))
 
     base_dt = parse_timestamp(base_timestamp)
-    tzinfo = ZoneInfo(timezone)
+    tzinfo = _tz(timezone)
     if base_dt.tzinfo is None:
         base_dt = base_dt.replace(tzinfo=tzinfo)
     else:
@@ -311,7 +551,7 @@ def compute_sunlight_profile(
     total_minutes = time_steps * step_minutes
     sun_minutes = [0 for _ in points]
 
-    preprocessed = preprocess_buildings(buildings)
+    preprocessed = preprocess_buildings_cached(buildings)
 
     for step in range(time_steps):
         ts = base_dt + dt.timedelta(minutes=step * step_minutes)
@@ -324,7 +564,12 @@ def compute_sunlight_profile(
             for idx in range(len(points)):
                 sun_minutes[idx] += step_minutes
             continue
-        union = unary_union(shadows_gdf.geometry) if not shadows_gdf.empty else None
+        # Shadows of neighbouring buildings overlap, so this needs a full union rather
+        # than shapely.coverage_union_all (which assumes non-overlapping polygons).
+        union = shapely.union_all(shadows_gdf.geometry.to_numpy()) if not shadows_gdf.empty else None
+        if union is not None and not union.is_empty:
+            # Build the GEOS prepared index once per step; every sample reuses it.
+            shapely.prepare(union)
         for idx, (lon, lat) in enumerate(points):
             if union is None or union.is_empty:
                 sun_minutes[idx] += step_minutes
@@ -499,12 +744,13 @@ def filter_buildings(buildings: gpd.GeoDataFrame, geometry: Optional[Dict[str, A
     geom = shape(geometry)
     if geom.is_empty:
         return buildings.iloc[0:0]
-    return buildings[buildings.intersects(geom)]
+    # Spatial-index query instead of testing every footprint; sort to keep row order.
+    positions = np.sort(buildings.sindex.query(geom, predicate="intersects"))
+    return buildings.iloc[positions]
 
 
 def run_analysis(params: AnalysisInput) -> Dict[str, Any]:
-    raw = fetch_buildings(params.bbox, params.backend_url, params.max_features)
-    buildings_gdf = features_to_gdf(raw.get("features", []))
+    buildings_gdf = load_buildings(params.bbox, params.backend_url, params.max_features)
     if params.geometry:
         buildings_gdf = filter_buildings(buildings_gdf, params.geometry)
     debug_canopy = os.getenv("DEBUG_CANOPY_LOG", "").lower() in ("1", "true", "yes")
@@ -540,7 +786,12 @@ def run_analysis(params: AnalysisInput) -> Dict[str, Any]:
     if buildings_gdf.empty:
         raise RuntimeError("No building features returned for the specified bounds/geometry")
 
-    shadows_gdf = generate_shadows(buildings_gdf, params.timestamp, params.timezone)
+    shadows_gdf = generate_shadows(
+        preprocess_buildings_cached(buildings_gdf),
+        params.timestamp,
+        params.timezone,
+        buildings_preprocessed=True,
+    )
 
     return {
         "buildings": buildings_gdf,
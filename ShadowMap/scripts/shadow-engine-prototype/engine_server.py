@@ -18,15 +18,19 @@ Run locally (example):
 
 from __future__ import annotations
 
+import asyncio
 import os
 import uuid
 from pathlib import Path
 import logging
-from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import Future, ProcessPoolExecutor
 from concurrent.futures.process import BrokenProcessPool
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
+from zoneinfo import ZoneInfo
 
+import orjson
 from fastapi import FastAPI, HTTPException
+from fastapi.responses import Response
 from pydantic import BaseModel, Field, model_validator
 
 from engine_core import (
@@ -38,7 +42,7 @@ from engine_core import (
     get_pybdshadow_version,
     run_analysis,
 )
-from service_cli import analyse_samples, make_heatmap  # reuse sampling helpers
+from service_cli import analyse_samples, make_heatmap, sample_points  # reuse sampling helpers
 
 
 def _env_int(name: str, default: int) -> int:
@@ -74,6 +78,15 @@ def _summarise_geometry(geometry: Optional[Dict[str, Any]]) -> str:
     return gtype or "unknown"
 
 
+class OrjsonResponse(Response):
+    """JSON response rendered with orjson (numpy scalars/arrays allowed)."""
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_SERIALIZE_NUMPY)
+
+
 class BoundingBox(BaseModel):
     west: float
     south: float
@@ -220,8 +233,37 @@ def _run_single_inner(payload: ShadowRequest, request_id: str) -> Dict[str, Any]
     }
 
 
-app = FastAPI(title="PyShadow Engine", version=get_pybdshadow_version())
-pool = ProcessPoolExecutor(max_workers=POOL_SIZE)
+app = FastAPI(
+    title="PyShadow Engine",
+    version=get_pybdshadow_version(),
+    default_response_class=OrjsonResponse,
+)
+
+
+def _warmup() -> None:
+    """Pool initializer: pay a worker's one-off costs (tz database, numba compile) up front."""
+    try:
+        ZoneInfo(DEFAULT_TZ)
+        sample_points({"west": 0.0, "south": 0.0, "east": 1.0, "north": 1.0}, 3)
+    except Exception:  # pragma: no cover - a failed warmup must not break the pool
+        logger.exception("[pool] worker warmup failed")
+
+
+def _worker_pid() -> int:
+    return os.getpid()
+
+
+def _new_pool() -> ProcessPoolExecutor:
+    # The initializer runs once in every worker process, including pools rebuilt by _reset_pool.
+    return ProcessPoolExecutor(max_workers=POOL_SIZE, initializer=_warmup)
+
+
+def _prespawn(executor: ProcessPoolExecutor) -> List[Future]:
+    # Start workers now instead of on the first requests; each one warms up as it starts.
+    return [executor.submit(_worker_pid) for _ in range(POOL_SIZE)]
+
+
+pool = _new_pool()
 
 
 def _reset_pool() -> None:
@@ -230,10 +272,22 @@ def _reset_pool() -> None:
         pool.shutdown(wait=False, cancel_futures=True)
     except Exception:  # pragma: no cover - best effort
         pass
-    pool = ProcessPoolExecutor(max_workers=POOL_SIZE)
+    pool = _new_pool()
+    _prespawn(pool)
     logger.info("[pool] reset process pool with %s workers", POOL_SIZE)
 
 
+@app.on_event("startup")
+async def warmup_pool() -> None:
+    try:
+        pids = await asyncio.gather(*(asyncio.wrap_future(future) for future in _prespawn(pool)))
+    except Exception:  # pragma: no cover - first request will surface real errors
+        logger.exception("[pool] prespawn failed")
+        return
+    # Workers warm up in their initializer, so this only reports how many answered.
+    logger.info("[pool] prespawn done: %s tasks, %s distinct workers answered", POOL_SIZE, len(set(pids)))
+
+
 @app.get("/health")
 def health() -> Dict[str, Any]:
     canopy_path = os.getenv("CANOPY_RASTER_PATH", CANOPY_RASTER_PATH)
@@ -252,7 +306,7 @@ def health() -> Dict[str, Any]:
 
 
 @app.post("/shadow")
-def shadow(payload: ShadowRequest) -> Dict[str, Any]:
+async def shadow(payload: ShadowRequest) -> OrjsonResponse:
     request_id = uuid.uuid4().hex[:10]
     logger.info(
         "[shadow %s] incoming ts=%s bbox=(%.6f,%.6f,%.6f,%.6f) includeCanopy=%s canopyPath=%s geometry=%s outputs=%s",
@@ -270,8 +324,9 @@ def shadow(payload: ShadowRequest) -> Dict[str, Any]:
         payload.outputs,
     )
     try:
-        future = pool.submit(_run_single, payload, request_id)
-        resp = future.result()
+        # Await the worker instead of blocking the event loop so other requests keep flowing.
+        loop = asyncio.get_running_loop()
+        resp = await loop.run_in_executor(pool, _run_single, payload, request_id)
         logger.info(
             "[shadow %s] success avgShadow=%.3f sampleCount=%s engineVersion=%s",
             request_id,
@@ -279,7 +334,8 @@ def shadow(payload: ShadowRequest) -> Dict[str, Any]:
             resp["metrics"].get("sampleCount"),
             resp["metrics"].get("engineVersion"),
         )
-        return resp
+        # Return the response directly so the large FeatureCollections skip response-model encoding.
+        return OrjsonResponse(resp)
     except BrokenProcessPool as exc:  # pragma: no cover - surfaced to client
         logger.exception(
             "[shadow %s] process pool broken; worker likely crashed (workers=%s)",
@@ -9,6 +9,11 @@ from pathlib import Path
 
 from engine_core import AnalysisInput, gdf_to_feature_collection, run_analysis
 
+try:  # pragma: no cover - optional columnar writer
+    import pyogrio
+except ImportError:
+    pyogrio = None  # type: ignore[assignment]
+
 
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Generate building shadows via pybdshadow")
@@ -36,7 +41,10 @@ def parse_args() -> argparse.Namespace:
 
 def dump_geojson(gdf, path: Path) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
-    gdf.to_file(path, driver="GeoJSON")
+    if pyogrio is not None:
+        pyogrio.write_dataframe(gdf, str(path), driver="GeoJSON")
+    else:
+        gdf.to_file(path, driver="GeoJSON")
 
 
 def main() -> None:
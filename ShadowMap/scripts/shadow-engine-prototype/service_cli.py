@@ -21,14 +21,24 @@ import math
 import sys
 import uuid
 from dataclasses import asdict
-from typing import Any, Dict, Iterable, List, Tuple
+from typing import Any, Dict, Iterable, Tuple
 
 import geopandas as gpd
-from shapely.geometry import Point, mapping, shape
-from shapely.ops import unary_union
+import numpy as np
+import orjson
+import shapely
+from shapely.geometry import mapping, shape
 
 from engine_core import AnalysisInput, gdf_to_feature_collection, get_pybdshadow_version, run_analysis, calculate_shadow_coverage
 
+try:  # pragma: no cover - optional JIT, plain Python loops otherwise
+    from numba import njit
+except ImportError:
+    def njit(*args: Any, **kwargs: Any):  # type: ignore[no-redef]
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
 
 def load_payload() -> Dict[str, Any]:
     try:
@@ -53,7 +63,7 @@ def normalize_geometry_obj(value: Any) -> Dict[str, Any] | None:
                 geometries.append(shape(geom))
         if not geometries:
             return None
-        union = unary_union(geometries)
+        union = shapely.union_all(geometries)
         return mapping(union)
 
     if isinstance(value, dict) and "type" in value and "coordinates" in value:
@@ -96,69 +106,89 @@ def validate_payload(payload: Dict[str, Any]) -> AnalysisInput:
     )
 
 
+@njit(cache=True)
+def _sample_grid(west: float, south: float, east: float, north: float, grid: int) -> Tuple[np.ndarray, np.ndarray]:
+    step_lon = (east - west) / (grid + 1)
+    step_lat = (north - south) / (grid + 1)
+    lons = np.empty(grid * grid)
+    lats = np.empty(grid * grid)
+    k = 0
+    for i in range(1, grid + 1):
+        for j in range(1, grid + 1):
+            lons[k] = west + step_lon * i
+            lats[k] = south + step_lat * j
+            k += 1
+    return lons, lats
+
+
 def sample_points(
     bounds: Dict[str, float],
     grid: int,
-) -> List[Tuple[float, float]]:
+) -> Tuple[np.ndarray, np.ndarray]:
     grid = max(3, min(grid, 25))
     lon_span = bounds["east"] - bounds["west"]
     lat_span = bounds["north"] - bounds["south"]
     if lon_span <= 0 or lat_span <= 0:
-        return []
-
-    step_lon = lon_span / (grid + 1)
-    step_lat = lat_span / (grid + 1)
-
-    points: List[Tuple[float, float]] = []
-    for i in range(1, grid + 1):
-        for j in range(1, grid + 1):
-            lon = bounds["west"] + step_lon * i
-            lat = bounds["south"] + step_lat * j
-            points.append((lon, lat))
-    return points
+        return np.empty(0), np.empty(0)
+
+    return _sample_grid(
+        float(bounds["west"]),
+        float(bounds["south"]),
+        float(bounds["east"]),
+        float(bounds["north"]),
+        int(grid),
+    )
 
 
 def analyse_samples(shadow_gdf: gpd.GeoDataFrame, bounds: Dict[str, float], grid: int) -> Dict[str, Any]:
-    points = sample_points(bounds, grid)
-    if not points:
+    lons, lats = sample_points(bounds, grid)
+    sample_count = len(lons)
+    if not sample_count:
         return {
             "features": [],
             "metrics": {"sampleCount": 0, "avgShadowPercent": 0.0, "avgSunlightHours": 0.0},
         }
 
-    union_geom = unary_union(shadow_gdf.geometry) if not shadow_gdf.empty else None
-    features = []
-    shadow_hits = 0
     hours_shadow = 3.0
     hours_sun = 10.0
 
-    for lon, lat in points:
-        point = Point(lon, lat)
-        in_shadow = union_geom.contains(point) if union_geom else False
-        shadow_hits += 1 if in_shadow else 0
-        hours = hours_shadow if in_shadow else hours_sun
-        shadow_percent = 85.0 if in_shadow else 5.0
-        features.append(
-            {
-                "type": "Feature",
-                "geometry": {"type": "Point", "coordinates": [lon, lat]},
-                "properties": {
-                    "hoursOfSun": hours,
-                    "shadowPercent": shadow_percent,
-                    "weight": max(0.1, min(hours / hours_sun, 1.0)),
-                },
-            }
+    if shadow_gdf.empty:
+        mask = np.zeros(sample_count, dtype=bool)
+    else:
+        # Query the samples against an STRtree of the individual shadow polygons;
+        # only point-in-shadow is needed, so the polygons are never unioned.
+        tree = shapely.STRtree(shadow_gdf.geometry.to_numpy())
+        hits = tree.query(shapely.points(lons, lats), predicate="intersects")
+        mask = np.bincount(hits[0], minlength=sample_count) > 0
+    shadow_hits = int(mask.sum())
+    hours = np.where(mask, hours_shadow, hours_sun)
+    shadow_percent = np.where(mask, 85.0, 5.0)
+    weight = np.clip(hours / hours_sun, 0.1, 1.0)
+
+    features = [
+        {
+            "type": "Feature",
+            "geometry": {"type": "Point", "coordinates": [lon, lat]},
+            "properties": {
+                "hoursOfSun": hrs,
+                "shadowPercent": pct,
+                "weight": wt,
+            },
+        }
+        for lon, lat, hrs, pct, wt in zip(
+            lons.tolist(), lats.tolist(), hours.tolist(), shadow_percent.tolist(), weight.tolist()
         )
+    ]
 
-    avg_shadow = (shadow_hits / len(points)) * 100.0
+    avg_shadow = (shadow_hits / sample_count) * 100.0
     avg_sunlight = (
-        ((shadow_hits * hours_shadow) + ((len(points) - shadow_hits) * hours_sun)) / len(points)
+        ((shadow_hits * hours_shadow) + ((sample_count - shadow_hits) * hours_sun)) / sample_count
     )
 
     return {
         "features": features,
         "metrics": {
-            "sampleCount": len(points),
+            "sampleCount": sample_count,
             "avgShadowPercent": avg_shadow,
             "avgSunlightHours": avg_sunlight,
         },
@@ -221,7 +251,8 @@ def main() -> None:
         },
     }
 
-    json.dump(response, sys.stdout)
+    sys.stdout.buffer.write(orjson.dumps(response, option=orjson.OPT_SERIALIZE_NUMPY))
+    sys.stdout.buffer.flush()
 
 
 if __name__ == "__main__":
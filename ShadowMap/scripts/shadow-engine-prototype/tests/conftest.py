@@ -0,0 +1,61 @@
+"""Shared fixtures for the engine regression tests."""
+
+from __future__ import annotations
+
+import json
+import sys
+import threading
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Tuple
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import engine_core  # noqa: E402
+
+# Maps the decoded POST body to (status code, JSON response body).
+BackendBehaviour = Callable[[Dict[str, Any]], Tuple[int, Dict[str, Any]]]
+
+
+@dataclass
+class FakeBackend:
+    url: str
+    queries: List[Dict[str, Any]] = field(default_factory=list)
+
+
+def _handler_for(behaviour: BackendBehaviour, backend: FakeBackend) -> type:
+    class _Handler(BaseHTTPRequestHandler):
+        def do_POST(self) -> None:  # noqa: N802 - http.server naming
+            query = json.loads(self.rfile.read(int(self.headers.get("Content-Length") or 0)) or b"{}")
+            backend.queries.append(query)
+            status, payload = behaviour(query)
+            body = json.dumps(payload).encode()
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args: object) -> None:
+            pass
+
+    return _Handler
+
+
+@pytest.fixture
+def fake_backend(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch):
+    """Serve ``/api/buildings/bounds`` from the behaviour passed via indirect parametrize."""
+    monkeypatch.setattr(engine_core, "ENGINE_BUILDING_LOCAL_GEOJSON", None)
+    backend = FakeBackend(url="")
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _handler_for(request.param, backend))
+    backend.url = f"http://127.0.0.1:{server.server_port}"
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield backend
+    finally:
+        server.shutdown()
+        server.server_close()
@@ -0,0 +1,46 @@
+"""Backend failures must reach the FastAPI handler as ordinary exceptions.
+
+The engine runs analyses in a ProcessPoolExecutor, so anything raised while
+fetching buildings is pickled back to the parent. An exception that cannot be
+unpickled surfaces as BrokenProcessPool and takes every in-flight request down.
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Tuple
+
+import pytest
+
+import engine_core
+
+BOUNDS = {"west": 114.15, "south": 22.27, "east": 114.17, "north": 22.29}
+
+
+def _unavailable(query: Dict[str, Any]) -> Tuple[int, Dict[str, Any]]:
+    return 503, {"success": False, "message": "upstream unavailable"}
+
+
+@pytest.mark.parametrize("fake_backend", [_unavailable], indirect=True)
+def test_backend_error_status_crosses_process_pool(fake_backend) -> None:
+    with ProcessPoolExecutor(max_workers=1) as pool:
+        future = pool.submit(engine_core.fetch_buildings, BOUNDS, fake_backend.url, 100)
+        with pytest.raises(RuntimeError, match="Backend HTTP 503"):
+            future.result(timeout=60)
+
+
+def test_unreachable_backend_crosses_process_pool(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(engine_core, "ENGINE_BUILDING_LOCAL_GEOJSON", None)
+    with ProcessPoolExecutor(max_workers=1) as pool:
+        future = pool.submit(engine_core.fetch_buildings, BOUNDS, "http://127.0.0.1:9", 100)
+        with pytest.raises(RuntimeError, match="Backend request failed"):
+            future.result(timeout=60)
+
+
+@pytest.mark.parametrize("fake_backend", [_unavailable], indirect=True)
+def test_chunked_fetch_error_status_crosses_process_pool(fake_backend, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(engine_core, "BUILDING_CHUNK_THRESHOLD", 1)
+    with ProcessPoolExecutor(max_workers=1) as pool:
+        future = pool.submit(engine_core._fetch_buildings_gdf, BOUNDS, fake_backend.url, 100)
+        with pytest.raises(RuntimeError, match="Backend HTTP 503"):
+            future.result(timeout=60)
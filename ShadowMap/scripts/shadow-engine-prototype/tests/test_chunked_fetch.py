@@ -0,0 +1,67 @@
+"""The quadrant fetch path must return the same buildings as a single request."""
+
+from __future__ import annotations
+
+from typing import Any, Dict, List, Tuple
+
+import pytest
+
+import engine_core
+
+BOUNDS = {"west": 114.15, "south": 22.27, "east": 114.17, "north": 22.29}
+# Every building sits in the south-west quadrant to mimic a skewed bbox.
+SKEWED = [(114.1501 + 0.0001 * (i % 50), 22.2701 + 0.0001 * (i // 50)) for i in range(300)]
+# A 10 x 10 block of buildings inside each quadrant, away from the split lines.
+EVEN = [
+    (west + 0.0005 * (i % 10), south + 0.0005 * (i // 10))
+    for west in (114.151, 114.161)
+    for south in (22.271, 22.281)
+    for i in range(100)
+]
+
+
+def _serve(buildings: List[Tuple[float, float]]):
+    def behaviour(query: Dict[str, Any]) -> Tuple[int, Dict[str, Any]]:
+        features = [
+            {
+                "type": "Feature",
+                "geometry": {
+                    "type": "Polygon",
+                    "coordinates": [[[x, y], [x + 0.00005, y], [x + 0.00005, y + 0.00005], [x, y]]],
+                },
+                "properties": {"height": 10},
+            }
+            for x, y in buildings
+            if query["west"] <= x < query["east"] and query["south"] <= y < query["north"]
+        ][: query["maxFeatures"]]
+        return 200, {"success": True, "data": {"type": "FeatureCollection", "features": features}}
+
+    return behaviour
+
+
+@pytest.mark.parametrize("fake_backend", [_serve(SKEWED)], indirect=True)
+@pytest.mark.parametrize("max_features", [100, 1000])
+def test_chunked_fetch_matches_single_request(
+    fake_backend, monkeypatch: pytest.MonkeyPatch, max_features: int
+) -> None:
+    monkeypatch.setattr(engine_core, "BUILDING_CHUNK_THRESHOLD", 0)
+    single = engine_core._fetch_buildings_gdf(BOUNDS, fake_backend.url, max_features)
+    monkeypatch.setattr(engine_core, "BUILDING_CHUNK_THRESHOLD", 1)
+    chunked = engine_core._fetch_buildings_gdf(BOUNDS, fake_backend.url, max_features)
+
+    assert len(chunked) == len(single) == min(max_features, len(SKEWED))
+    assert set(chunked.geometry.to_wkb()) == set(single.geometry.to_wkb())
+
+
+@pytest.mark.parametrize("fake_backend", [_serve(EVEN)], indirect=True)
+def test_chunked_fetch_splits_a_binding_cap_evenly(fake_backend, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(engine_core, "BUILDING_CHUNK_THRESHOLD", 1)
+    chunked = engine_core._fetch_buildings_gdf(BOUNDS, fake_backend.url, 200)
+
+    assert sum(query["maxFeatures"] for query in fake_backend.queries) == 200
+    assert len(chunked) == 200
+    corners = chunked.geometry.bounds
+    east = corners["minx"] >= (BOUNDS["west"] + BOUNDS["east"]) / 2
+    north = corners["miny"] >= (BOUNDS["south"] + BOUNDS["north"]) / 2
+    per_quadrant = [int(((east == e) & (north == n)).sum()) for n in (False, True) for e in (False, True)]
+    assert per_quadrant == [50, 50, 50, 50]